@@ -0,0 +1,8 @@
+import tempfile
+import os
+
+
+# The package logs to logs/bot.log as soon as it is imported, so run the tests
+# from a scratch directory which also keeps cookie and transport files out of the repo
+os.chdir(tempfile.mkdtemp())
+os.makedirs("logs", exist_ok=True)
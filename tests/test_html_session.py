@@ -0,0 +1,80 @@
+import asyncio
+
+from webscraper import html_session
+from webscraper.src import transport_selector
+from webscraper.src.transport_selector import TransportSelector, AIOHTTP, TLS_CLIENT
+
+
+DEAD_URL = "https://www.dead.com/listing"
+HEALTHY_URL = "https://www.healthy.com/listing"
+ARGOS_URL = "https://www.argos.co.uk/product/1"
+
+
+def test_monitor_backs_off_dead_pages(monkeypatch):
+    fetches = {DEAD_URL: 0, HEALTHY_URL: 0}
+    changes = []
+
+    async def fake_request(urls):
+        responses = []
+        for url in urls:
+            fetches[url] += 1
+            responses.append({"status": 404} if url == DEAD_URL else "<html><p>price</p></html>")
+        return responses
+
+    monkeypatch.setattr(html_session, "aiohttp_request", fake_request)
+    monkeypatch.setattr(html_session, "tls_client_request", fake_request)
+
+    scraping_config = {"dead": {"config": None}, "healthy": {"config": None}}
+    monitor = html_session.monitor_async(
+        [DEAD_URL, HEALTHY_URL], scraping_config, changes.append,
+        batch_delay_seconds=0.01, initial_interval=0.1, min_interval=0.1, max_interval=0.4,
+    )
+
+    async def run_for_a_while():
+        try:
+            await asyncio.wait_for(monitor, timeout=2)
+        except asyncio.TimeoutError:
+            pass
+
+    asyncio.run(run_for_a_while())
+
+    # The dead page backs off like a page that never changes
+    assert 2 < fetches[DEAD_URL] <= fetches[HEALTHY_URL] + 1
+
+    # Each url is reported once, the dead one with its status
+    assert changes.count({DEAD_URL: {"status": 404}}) == 1
+    assert sum(HEALTHY_URL in change for change in changes) == 1
+
+
+def seed_escalated_argos(tmp_path, monkeypatch):
+    # Save an escalated argos whose probe is long overdue
+    monkeypatch.setattr(transport_selector, "TRANSPORT_STATS_PATH", str(tmp_path / "transport.pkl"))
+    transport_selector.save_transport_stats({
+        "argos": {"transport": TLS_CLIENT, "outcomes": [True], "last-probe": 0, "probing": False}
+    })
+
+
+def test_filter_without_selector_does_not_probe(tmp_path, monkeypatch):
+    seed_escalated_argos(tmp_path, monkeypatch)
+
+    for _ in range(2):
+        urls = html_session.filter_urls_by_website([ARGOS_URL])
+        assert urls["tls-client-urls"] == [ARGOS_URL]
+
+
+def test_fetch_and_scrape_probe_is_recorded_and_saved(tmp_path, monkeypatch):
+    seed_escalated_argos(tmp_path, monkeypatch)
+    requested = []
+
+    async def fake_aiohttp_request(urls):
+        requested.extend(urls)
+        return ["<html></html>" for _ in urls]
+
+    monkeypatch.setattr(html_session, "aiohttp_request", fake_aiohttp_request)
+    monkeypatch.setattr(html_session, "tls_client_request", fake_aiohttp_request)
+
+    asyncio.run(html_session.fetch_and_scrape([ARGOS_URL], {"argos": {"config": None}}))
+
+    # The probe went through aiohttp, succeeded and the switch back was saved
+    assert requested == [ARGOS_URL]
+    assert TransportSelector().select("argos") == AIOHTTP
@@ -0,0 +1,98 @@
+from webscraper.src.monitor_scheduler import MonitorScheduler
+
+
+def visit(scheduler, url, data, now, failed=False):
+    # Pop the url when it is due and record the data scraped from it
+    assert scheduler.pop_due(1, now=now) == [url]
+    return scheduler.update(url, data, failed, now=now)
+
+
+def test_first_pass_pops_each_url_once_in_order():
+    scheduler = MonitorScheduler(["a", "b", "a", "c"])
+
+    assert scheduler.pop_due(2) == ["a", "b"]
+    assert scheduler.pop_due(2) == ["c"]
+    assert scheduler.pop_due(2) == []
+    assert scheduler.seconds_until_next() is None
+
+
+def test_first_pass_is_staggered():
+    scheduler = MonitorScheduler(["a", "b", "c"], stagger_seconds=1000)
+
+    assert scheduler.pop_due(10) == ["a"]
+    assert 0 < scheduler.seconds_until_next() <= 1000
+
+
+def test_interval_follows_changes():
+    scheduler = MonitorScheduler(["a"], initial_interval=100, min_interval=10, max_interval=1000, jitter=0)
+    scheduler.pop_due(1)
+
+    # The first visit is reported and keeps the initial interval
+    assert scheduler.update("a", {"price": 1}, now=0) is True
+    assert scheduler.seconds_until_next(now=0) == 100
+
+    # Unchanged data doubles the interval
+    assert visit(scheduler, "a", {"price": 1}, now=100) is False
+    assert scheduler.seconds_until_next(now=100) == 200
+
+    # Changed data halves it
+    assert visit(scheduler, "a", {"price": 2}, now=300) is True
+    assert scheduler.seconds_until_next(now=300) == 100
+
+
+def test_interval_stays_within_bounds():
+    scheduler = MonitorScheduler(["steady", "busy"], initial_interval=100, min_interval=50, max_interval=300, jitter=0)
+    scheduler.pop_due(2)
+    scheduler.update("steady", {"price": 1}, now=0)
+    scheduler.update("busy", {"price": 0}, now=0)
+
+    for price in range(1, 4):
+        # Both urls are due again well before the next step
+        assert sorted(scheduler.pop_due(2, now=1000 * price)) == ["busy", "steady"]
+        scheduler.update("steady", {"price": 1}, now=1000 * price)
+        scheduler.update("busy", {"price": price}, now=1000 * price)
+
+    assert scheduler.pop_due(2, now=3049) == []
+    assert scheduler.pop_due(2, now=3050) == ["busy"]
+    assert scheduler.pop_due(2, now=3299) == []
+    assert scheduler.pop_due(2, now=3300) == ["steady"]
+
+
+def test_failures_back_off_and_are_reported_once():
+    scheduler = MonitorScheduler(["a"], initial_interval=100, min_interval=10, max_interval=1000, jitter=0)
+    scheduler.pop_due(1)
+    scheduler.update("a", {"price": 1}, now=0)
+
+    assert visit(scheduler, "a", {"status": 404}, now=100, failed=True) is True
+    assert scheduler.seconds_until_next(now=100) == 200
+
+    assert visit(scheduler, "a", {"status": 404}, now=300, failed=True) is False
+    assert scheduler.seconds_until_next(now=300) == 400
+
+
+def test_reschedule_backs_off():
+    scheduler = MonitorScheduler(["a"], initial_interval=100, min_interval=10, max_interval=1000, jitter=0)
+    scheduler.pop_due(1)
+    scheduler.reschedule("a", now=0)
+
+    assert scheduler.pop_due(1, now=199) == []
+    assert scheduler.pop_due(1, now=200) == ["a"]
+
+
+def test_jitter_spreads_due_times():
+    urls = ["a", "b", "c", "d", "e", "f"]
+    scheduler = MonitorScheduler(urls, initial_interval=100, min_interval=10, max_interval=1000, jitter=0.5)
+    scheduler.pop_due(len(urls))
+    for url in urls:
+        scheduler.update(url, {"price": 1}, now=0)
+
+    assert scheduler.pop_due(len(urls), now=49) == []
+
+    # Step through the jitter window and note when each url becomes due
+    due_times = set()
+    for now in range(50, 151):
+        if scheduler.pop_due(len(urls), now=now):
+            due_times.add(now)
+
+    assert scheduler.seconds_until_next() is None
+    assert len(due_times) > 1
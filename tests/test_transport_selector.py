@@ -0,0 +1,151 @@
+import pytest
+
+from webscraper.src import transport_selector
+from webscraper.src.transport_selector import TransportSelector, AIOHTTP, TLS_CLIENT
+from webscraper.src.processors import filter_urls_by_website
+
+
+BLOCKED = {"status": 403}
+OK = "<html></html>"
+PROBE_INTERVAL = 3600
+
+
+class Clock:
+    # Stands in for the time module so probes can be stepped through
+    def __init__(self):
+        self.now = 0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def clock(tmp_path, monkeypatch):
+    monkeypatch.setattr(transport_selector, "TRANSPORT_STATS_PATH", str(tmp_path / "transport.pkl"))
+    clock = Clock()
+    monkeypatch.setattr(transport_selector, "time", clock)
+    return clock
+
+
+def test_unknown_websites_start_on_aiohttp():
+    selector = TransportSelector()
+
+    assert selector.select("shop") == AIOHTTP
+    assert selector.select("argos") == TLS_CLIENT
+
+
+def test_escalates_once_block_rate_crosses_threshold():
+    selector = TransportSelector(min_samples=4)
+
+    # Not enough samples to decide yet
+    for _ in range(3):
+        assert selector.record("other", BLOCKED) is True
+    assert selector.select("other") == AIOHTTP
+
+    # Below the threshold
+    for response in [BLOCKED, OK, OK, OK, BLOCKED]:
+        selector.record("shop", response)
+    assert selector.select("shop") == AIOHTTP
+
+    selector.record("shop", BLOCKED)
+    assert selector.select("shop") == TLS_CLIENT
+
+
+def test_failures_and_outages_are_not_blocks():
+    selector = TransportSelector(min_samples=2)
+
+    for response in [{"status": 503}, {"status": 404}]:
+        assert selector.record("shop", response) is False
+    assert selector.select("shop") == AIOHTTP
+
+    # Connection errors are left out of the window entirely
+    for _ in range(5):
+        assert selector.record("other", None) is False
+    selector.record("other", BLOCKED)
+    assert selector.select("other") == AIOHTTP
+
+
+def test_single_probe_per_interval(clock):
+    selector = TransportSelector(probe_interval=PROBE_INTERVAL)
+    assert selector.select("argos") == TLS_CLIENT
+
+    clock.now = PROBE_INTERVAL
+    assert selector.select("argos") == AIOHTTP
+    assert selector.select("argos") == TLS_CLIENT
+
+    clock.now = PROBE_INTERVAL * 2 - 1
+    assert selector.select("argos") == TLS_CLIENT
+
+    clock.now = PROBE_INTERVAL * 2
+    assert selector.select("argos") == AIOHTTP
+
+
+def test_blocked_probe_stays_escalated(clock):
+    selector = TransportSelector(probe_interval=PROBE_INTERVAL)
+    selector.select("argos")
+
+    clock.now = PROBE_INTERVAL
+    assert selector.select("argos") == AIOHTTP
+    assert selector.record("argos", BLOCKED) is True
+    assert selector.select("argos") == TLS_CLIENT
+
+
+def test_successful_probe_de_escalates(clock):
+    selector = TransportSelector(probe_interval=PROBE_INTERVAL)
+    selector.select("argos")
+
+    clock.now = PROBE_INTERVAL
+    assert selector.select("argos") == AIOHTTP
+    assert selector.record("argos", OK) is False
+
+    clock.now = PROBE_INTERVAL * 5
+    assert selector.select("argos") == AIOHTTP
+
+
+def test_overrides_are_pinned_and_never_retried():
+    selector = TransportSelector(overrides={"shop": AIOHTTP, "argos": AIOHTTP}, min_samples=1)
+
+    for _ in range(10):
+        assert selector.record("shop", BLOCKED) is False
+    selector.save()
+
+    assert selector.select("shop") == AIOHTTP
+    assert selector.select("argos") == AIOHTTP
+
+    # Nothing was learned from the pinned website's blocks
+    assert TransportSelector(min_samples=1).select("shop") == AIOHTTP
+
+
+def test_unknown_override_is_rejected():
+    with pytest.raises(ValueError):
+        TransportSelector(overrides={"shop": "tls_client"})
+
+
+def test_learned_transport_is_saved():
+    selector = TransportSelector(min_samples=1)
+    selector.record("shop", BLOCKED)
+    selector.save()
+
+    assert TransportSelector().select("shop") == TLS_CLIENT
+
+
+def test_saved_outcomes_use_current_window_size():
+    selector = TransportSelector(window_size=20)
+    for _ in range(3):
+        selector.record("shop", OK)
+    selector.save()
+
+    # With a window of 2 the earlier successes no longer outweigh one block
+    reloaded = TransportSelector(window_size=2, min_samples=2)
+    reloaded.record("shop", BLOCKED)
+    assert reloaded.select("shop") == TLS_CLIENT
+
+
+def test_filter_urls_by_website_routes_by_selector():
+    selector = TransportSelector(overrides={"shop": TLS_CLIENT})
+    urls = ["https://www.shop.com/a", "https://www.other.com/b"]
+
+    assert filter_urls_by_website(urls, selector) == {
+        "aiohttp-urls": ["https://www.other.com/b"],
+        "tls-client-urls": ["https://www.shop.com/a"],
+    }
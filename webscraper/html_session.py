@@ -1,6 +1,8 @@
 # Local Imports
 from .src.processors import *
 from .src.web_request import aiohttp_request, tls_client_request
+from .src.monitor_scheduler import MonitorScheduler
+from .src.transport_selector import TransportSelector
 from .src.config_logger import setup_logger
 
 from bs4 import BeautifulSoup
@@ -22,11 +24,12 @@ def signal_handler(sig, frame):
 
 
 
-async def run_async(urls, scraping_config, batch_size=10, batch_delay_seconds=5):
+async def run_async(urls, scraping_config, batch_size=10, batch_delay_seconds=5, transport_overrides=None):
     """Main function to process all batches asynchronously."""
     signal.signal(signal.SIGINT, signal_handler)
     
     queue = order_urls(urls, batch_size)
+    transport_selector = TransportSelector(transport_overrides)
     results = {}
     
     try:
@@ -35,20 +38,7 @@ async def run_async(urls, scraping_config, batch_size=10, batch_delay_seconds=5)
             logger.info(f"Batch {queue.batch_number}/{queue.size}")
             
             batch_urls = queue.pop()
-            batch_request_urls = filter_urls_by_website(batch_urls)
-
-            # Process the batch of URLs asynchronously
-            responses, batch_urls_reordered = await process_batch(batch_request_urls)
-
-            # Prepare arguments for the scrape function
-            scrape_args = [
-                (scraping_config[extract_website_name_from_url(url)], response, url)
-                for response, url in zip(responses, batch_urls_reordered)
-            ]
-
-            # Use ThreadPoolExecutor to parallelize the scraping task
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                batch_results = list(executor.map(lambda args: scrape(*args), scrape_args))
+            _, _, batch_results = await fetch_and_scrape(batch_urls, scraping_config, transport_selector)
 
             # Update the results with the batch results
             for result in batch_results:
@@ -65,15 +55,110 @@ async def run_async(urls, scraping_config, batch_size=10, batch_delay_seconds=5)
     finally:
         return results
 
-def run(urls, scraping_config, batch_size=10, batch_delay_seconds=5):
+def run(urls, scraping_config, batch_size=10, batch_delay_seconds=5, transport_overrides=None):
     """Wrapper function to run the asynchronous main function."""
     # Use asyncio.run to run the async event loop
-    return asyncio.run(run_async(urls, scraping_config, batch_size, batch_delay_seconds))
+    return asyncio.run(run_async(urls, scraping_config, batch_size, batch_delay_seconds, transport_overrides))
+
+
+
+async def monitor_async(urls, scraping_config, on_change, batch_size=10, batch_delay_seconds=5, initial_interval=300, min_interval=60, max_interval=86400, transport_overrides=None):
+    """
+    Continuously monitor the urls. Each url is revisited on its own interval
+    which adapts to how often its scraped data changes, and only the records
+    which changed are passed to on_change. Failed requests are passed on
+    like run() returns them ({"status": ...} or {"redirect": ...}) when they
+    first fail and are polled less often while they keep failing.
+    """
+    signal.signal(signal.SIGINT, signal_handler)
+
+    # Interleave the domains and space the first pass out like run() does
+    scheduler = MonitorScheduler(
+        interleave_urls_by_domain(urls), initial_interval, min_interval, max_interval,
+        stagger_seconds=batch_delay_seconds / batch_size
+    )
+    transport_selector = TransportSelector(transport_overrides)
+
+    try:
+        while scheduler.length > 0:
+            # Sleep until the next url is due
+            await asyncio.sleep(scheduler.seconds_until_next())
+
+            batch_urls = scheduler.pop_due(batch_size)
+            if not batch_urls:
+                continue
+
+            # Urls which have not been scheduled again yet
+            pending_urls = set(batch_urls)
+
+            try:
+                logger.info(f"Monitoring {len(batch_urls)} urls, {scheduler.length} waiting")
+                batch_urls_reordered, responses, batch_results = await fetch_and_scrape(batch_urls, scraping_config, transport_selector)
+
+                changed_results = {}
+                for url, response, result in zip(batch_urls_reordered, responses, batch_results):
+                    pending_urls.discard(url)
+                    failed = response is None or isinstance(response, dict) or "error" in result[url]
+                    if scheduler.update(url, result[url], failed):
+                        changed_results.update(result)
+
+                if changed_results:
+                    on_change(changed_results)
+
+            except Exception as error:
+                logger.error(f"Error occurred: {error}")
+
+            finally:
+                # A failed batch must not drop its urls from the schedule
+                for url in pending_urls:
+                    scheduler.reschedule(url)
+
+            # Introduce a delay between processing batches
+            await asyncio.sleep(batch_delay_seconds)
+
+    except KeyboardInterrupt:
+        logger.info("Process interrupted by user.")
+
+def monitor(urls, scraping_config, on_change, batch_size=10, batch_delay_seconds=5, initial_interval=300, min_interval=60, max_interval=86400, transport_overrides=None):
+    """Wrapper function to run the asynchronous monitor function."""
+    return asyncio.run(monitor_async(urls, scraping_config, on_change, batch_size, batch_delay_seconds, initial_interval, min_interval, max_interval, transport_overrides))
+
+
+
+async def fetch_and_scrape(batch_urls, scraping_config, transport_selector=None):
+    """Request a batch of URLs and scrape each response."""
+    if transport_selector is None:
+        transport_selector = TransportSelector()
+
+    batch_request_urls = filter_urls_by_website(batch_urls, transport_selector)
+
+    # Process the batch of URLs asynchronously
+    responses, batch_urls_reordered = await process_batch(batch_request_urls, transport_selector)
+
+    # Persist what has been learned about each website's transport
+    transport_selector.save()
+
+    # Prepare arguments for the scrape function
+    scrape_args = [
+        (scraping_config[extract_website_name_from_url(url)], response, url)
+        for response, url in zip(responses, batch_urls_reordered)
+    ]
 
+    # Use ThreadPoolExecutor to parallelize the scraping task
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        batch_results = list(executor.map(lambda args: scrape(*args), scrape_args))
 
+    return batch_urls_reordered, responses, batch_results
 
-async def process_batch(batch_request_urls):
+
+
+async def process_batch(batch_request_urls, transport_selector=None):
     """Process a batch of URLs asynchronously."""
+    # A selector created here is saved below so its recorded outcomes are kept
+    owns_selector = transport_selector is None
+    if owns_selector:
+        transport_selector = TransportSelector()
+
     responses = []
     batch_urls_reordered = []
     
@@ -81,16 +166,41 @@ async def process_batch(batch_request_urls):
         batch_urls_reordered += request_urls
         if request_type == "aiohttp-urls":
             # Send asynchronous requests to the URLs in the current batch
-            filtered_responses = await aiohttp_request(request_urls)
+            filtered_responses = await aiohttp_request(request_urls) or [None] * len(request_urls)
+            filtered_responses = await retry_blocked_with_tls_client(request_urls, filtered_responses, transport_selector)
         elif request_type == "tls-client-urls":
-            filtered_responses = await tls_client_request(request_urls)
+            filtered_responses = await tls_client_request(request_urls) or [None] * len(request_urls)
 
         responses += filtered_responses
 
+    if owns_selector:
+        transport_selector.save()
+
     return responses, batch_urls_reordered
 
 
 
+async def retry_blocked_with_tls_client(urls, responses, transport_selector):
+    """Record each aiohttp outcome and retry the blocked URLs with tls_client."""
+    blocked_indexes = [
+        index for index, (url, response) in enumerate(zip(urls, responses))
+        if transport_selector.record(extract_website_name_from_url(url), response)
+    ]
+    if not blocked_indexes:
+        return responses
+
+    retry_responses = await tls_client_request([urls[index] for index in blocked_indexes])
+    if retry_responses is None:
+        return responses
+
+    responses = list(responses)
+    for index, response in zip(blocked_indexes, retry_responses):
+        responses[index] = response
+
+    return responses
+
+
+
 def scrape(*args):
     website_config, response, url = args
     scraped_data = {url: {}}
@@ -0,0 +1,114 @@
+import hashlib
+import heapq
+import random
+import json
+import time
+
+
+class MonitorScheduler:
+    """
+    Schedules urls for continuous monitoring. Each url keeps its own revisit
+    interval which shrinks when the scraped data changes and grows when it
+    does not, so pages which change often are polled more often. Revisits
+    are jittered so urls sharing an interval do not fire together.
+    """
+    def __init__(self, urls, initial_interval=300, min_interval=60, max_interval=86400, backoff_factor=2.0, speedup_factor=0.5, jitter=0.1, stagger_seconds=0) -> None:
+        self.initial_interval = initial_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.speedup_factor = speedup_factor
+        self.jitter = jitter
+
+        self.intervals = {}
+        self.fingerprints = {}
+        self.queue = []
+        self.counter = 0
+
+        # Spread the first pass out so the urls are not all due at once
+        now = time.monotonic()
+        for index, url in enumerate(dict.fromkeys(urls)):
+            self.intervals[url] = self.__clamp(initial_interval)
+            self.__push(url, now + index * stagger_seconds)
+
+        self.length = len(self.queue)
+
+
+    def pop_due(self, limit, now=None):
+        # Pop up to limit urls whose due time has passed, earliest first
+        now = time.monotonic() if now is None else now
+        due_urls = []
+        while self.queue and self.queue[0][0] <= now and len(due_urls) < limit:
+            _, _, url = heapq.heappop(self.queue)
+            due_urls.append(url)
+
+        self.length = len(self.queue)
+        return due_urls
+
+
+    def seconds_until_next(self, now=None):
+        # Time to wait until the next url is due, None if nothing is scheduled
+        if not self.queue:
+            return None
+        now = time.monotonic() if now is None else now
+        return max(0, self.queue[0][0] - now)
+
+
+    def update(self, url, data, failed=False, now=None):
+        """
+        Record the scraped data for a url, adapt its interval and schedule
+        its next visit. Returns True when the data differs from the last visit.
+        Failed visits always back off so dead pages are polled less and less.
+        """
+        now = time.monotonic() if now is None else now
+        fingerprint = self.__fingerprint(data)
+        previous = self.fingerprints.get(url)
+        self.fingerprints[url] = fingerprint
+
+        if failed:
+            changed = previous != fingerprint
+            self.intervals[url] = self.__clamp(self.intervals[url] * self.backoff_factor)
+        elif previous is None:
+            # First observation, there is nothing to compare against yet
+            changed = True
+        elif previous != fingerprint:
+            changed = True
+            self.intervals[url] = self.__clamp(self.intervals[url] * self.speedup_factor)
+        else:
+            changed = False
+            self.intervals[url] = self.__clamp(self.intervals[url] * self.backoff_factor)
+
+        self.__push(url, now + self.__next_delay(url))
+        return changed
+
+
+    def reschedule(self, url, now=None):
+        # Used when a url could not be processed, it is retried at a wider interval
+        now = time.monotonic() if now is None else now
+        self.intervals[url] = self.__clamp(self.intervals[url] * self.backoff_factor)
+        self.__push(url, now + self.__next_delay(url))
+
+
+    def __push(self, url, due):
+        # The counter keeps urls with the same due time in insertion order
+        self.counter += 1
+        heapq.heappush(self.queue, (due, self.counter, url))
+        self.length = len(self.queue)
+
+
+    def __next_delay(self, url):
+        # Randomise the delay around the interval to break up bursts
+        return self.intervals[url] * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+    def __clamp(self, interval):
+        return min(self.max_interval, max(self.min_interval, interval))
+
+
+    def __fingerprint(self, data):
+        encoded = json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha1(encoded).hexdigest()
+
+
+    def __str__(self):
+        return str(self.queue)
@@ -1,5 +1,6 @@
 # Local Imports
 from .batched_queue import BatchedQueue
+from .transport_selector import TransportSelector, TLS_CLIENT
 
 from urllib.parse import urlparse, urlunparse, urljoin, parse_qs, urlencode
 from collections import defaultdict
@@ -11,14 +12,22 @@ logger = logging.getLogger("SCRAPER")
 
 
 
-def filter_urls_by_website(urls):
+def filter_urls_by_website(urls, transport_selector=None):
+    """
+    Split the urls by the transport the selector has chosen for their website
+    """
+    # Without a shared selector nothing would record a probe's outcome,
+    # so only read the learned transports
+    probe = transport_selector is not None
+    if transport_selector is None:
+        transport_selector = TransportSelector()
+
     all_urls = {}
     tls_client_urls = []
     aiohttp_urls = []
 
     for url in urls:
-        website_name = extract_website_name_from_url(url)
-        if website_name in ["argos", "ebay", "steelseries", "dell", "currys", "turtlebeach", "acer"]:
+        if transport_selector.select(extract_website_name_from_url(url), probe) == TLS_CLIENT:
             tls_client_urls.append(url)
 
         else:
@@ -41,18 +50,7 @@ def order_urls(urls, batch_size):
         if len(urls) == 0:
             return urls
 
-        # Create a dictionary to group URLs by domain
-        url_groups = defaultdict(list)
-
-        for url in urls:
-            domain = url.split('/')[2]  # Extract domain from the url
-            url_groups[domain].append(url)
-        
-        # Sort the groups based on the count of URLs in each group
-        sorted_groups = sorted(url_groups.values(), key=len, reverse=True)
-        
-        # Interleave the groups to form the ordered list
-        ordered_urls = [url for i in range(max(map(len, sorted_groups))) for group in sorted_groups for url in group[i:i+1]]
+        ordered_urls = interleave_urls_by_domain(urls)
         batched_urls = BatchedQueue(ordered_urls, batch_size)
 
     except Exception as error:
@@ -63,6 +61,29 @@ def order_urls(urls, batch_size):
 
 
 
+def interleave_urls_by_domain(urls):
+    """
+    Order the urls so consecutive urls are from different domains
+    - website1, website2, website3, website1, website2, website3
+    """
+    if len(urls) == 0:
+        return []
+
+    # Create a dictionary to group URLs by domain
+    url_groups = defaultdict(list)
+
+    for url in urls:
+        domain = url.split('/')[2]  # Extract domain from the url
+        url_groups[domain].append(url)
+    
+    # Sort the groups based on the count of URLs in each group
+    sorted_groups = sorted(url_groups.values(), key=len, reverse=True)
+    
+    # Interleave the groups to form the ordered list
+    return [url for i in range(max(map(len, sorted_groups))) for group in sorted_groups for url in group[i:i+1]]
+
+
+
 def extract_website_name_from_url(url):
     """
     Extracts the website name from a url
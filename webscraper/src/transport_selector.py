@@ -0,0 +1,154 @@
+from collections import deque
+
+import logging
+import pickle
+import time
+import os
+
+
+logger = logging.getLogger("SCRAPER")
+
+# Path to the learned transport file
+TRANSPORT_STATS_PATH = "transport.pkl"
+
+AIOHTTP = "aiohttp"
+TLS_CLIENT = "tls-client"
+TRANSPORTS = [AIOHTTP, TLS_CLIENT]
+
+# Websites known to block aiohttp, used as the starting point before anything is learned
+DEFAULT_TLS_CLIENT_WEBSITES = ["argos", "ebay", "steelseries", "dell", "currys", "turtlebeach", "acer"]
+
+# Status codes which indicate the request was blocked rather than failed.
+# 503 is left out, like check_response_status it is treated as the server's fault
+BLOCKED_STATUS_CODES = [403, 429]
+
+
+
+def load_transport_stats():
+    """
+    Load the learned transports from the local file.
+    """
+    if os.path.exists(TRANSPORT_STATS_PATH) and os.path.getsize(TRANSPORT_STATS_PATH) > 0:
+        try:
+            with open(TRANSPORT_STATS_PATH, "rb") as f:
+                return pickle.load(f)
+        except EOFError:
+            return {}
+    return {}
+
+
+
+def save_transport_stats(stats):
+    """
+    Save the learned transports to the local file.
+    """
+    with open(TRANSPORT_STATS_PATH, "wb") as f:
+        pickle.dump(stats, f)
+
+
+
+def is_blocked_response(response):
+    """
+    Only a blocking status code counts as blocked
+    """
+    if isinstance(response, dict):
+        return response.get("status") in BLOCKED_STATUS_CODES
+    return False
+
+
+
+class TransportSelector:
+    """
+    Chooses between aiohttp and tls_client for each website. Websites start on
+    aiohttp and are escalated to tls_client once their aiohttp block rate
+    crosses the threshold. Escalated websites are probed with aiohttp every
+    probe_interval seconds and de-escalated when the probe is not blocked.
+    """
+    def __init__(self, overrides=None, block_threshold=0.5, window_size=20, min_samples=5, probe_interval=21600) -> None:
+        self.overrides = overrides or {}
+        for website_name, transport in self.overrides.items():
+            if transport not in TRANSPORTS:
+                raise ValueError(f"({website_name}) Unknown transport override '{transport}', expected one of {TRANSPORTS}")
+
+        self.block_threshold = block_threshold
+        self.window_size = window_size
+        self.min_samples = min_samples
+        self.probe_interval = probe_interval
+
+        # Outcomes are saved as lists so the current window_size applies to them
+        self.stats = load_transport_stats()
+        for stats in self.stats.values():
+            stats["outcomes"] = deque(stats["outcomes"], maxlen=window_size)
+
+
+    def select(self, website_name, probe=True):
+        # Returns the transport to request the website with. A probe must be
+        # followed by record() on the same selector or its outcome is lost
+        if website_name in self.overrides:
+            return self.overrides[website_name]
+
+        stats = self.__get_stats(website_name)
+        if probe and stats["transport"] == TLS_CLIENT and time.time() - stats["last-probe"] >= self.probe_interval:
+            # Send a single aiohttp request to see if the website still blocks it
+            stats["last-probe"] = time.time()
+            stats["probing"] = True
+            return AIOHTTP
+
+        return stats["transport"]
+
+
+    def record(self, website_name, response):
+        """
+        Record the outcome of an aiohttp request. Returns True when the
+        request was blocked and should be retried with tls_client.
+        """
+        if website_name in self.overrides:
+            # Pinned websites are never learned from or retried on another transport
+            return False
+
+        stats = self.__get_stats(website_name)
+        if response is None:
+            # Timeouts and connection errors say nothing about blocking
+            stats["probing"] = False
+            return False
+
+        blocked = is_blocked_response(response)
+        outcomes = stats["outcomes"]
+        outcomes.append(blocked)
+
+        if stats["probing"]:
+            stats["probing"] = False
+            if not blocked:
+                logger.info(f"({website_name}) aiohttp probe succeeded, switching back to aiohttp")
+                stats["transport"] = AIOHTTP
+                outcomes.clear()
+                outcomes.append(blocked)
+
+        elif stats["transport"] == AIOHTTP and len(outcomes) >= self.min_samples:
+            block_rate = sum(outcomes) / len(outcomes)
+            if block_rate >= self.block_threshold:
+                logger.info(f"({website_name}) aiohttp block rate {block_rate:.2f}, switching to tls_client")
+                stats["transport"] = TLS_CLIENT
+                stats["last-probe"] = time.time()
+
+        return blocked
+
+
+    def save(self):
+        save_transport_stats({
+            website_name: {**stats, "outcomes": list(stats["outcomes"])}
+            for website_name, stats in self.stats.items()
+        })
+
+
+    def __get_stats(self, website_name):
+        if website_name not in self.stats:
+            # Seed known websites on tls_client, they are probed like any escalated website
+            transport = TLS_CLIENT if website_name in DEFAULT_TLS_CLIENT_WEBSITES else AIOHTTP
+            self.stats[website_name] = {
+                "transport": transport,
+                "outcomes": deque(maxlen=self.window_size),
+                "last-probe": time.time(),
+                "probing": False,
+            }
+        return self.stats[website_name]